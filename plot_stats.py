@@ -15,7 +15,164 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.ticker as ticker
 
-def parse(path):
+try:
+    import pandas as pd
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+_MODAL_RE = re.compile(r'\((\d+)\)\s*$')  # "(count)" suffix of repr_tape
+
+
+def _parse_pandas(path):
+    """Vectorized parse: one C-level read_csv instead of a per-line loop."""
+    df = pd.read_csv(path, sep='\t', header=None, names=range(10),
+                     dtype=str, engine='c', skip_blank_lines=True)
+    df = df[df[0].notna() & df[0].str.strip().str[:1].str.isdigit()]
+    has_steps = df[7].notna().any()  # new format has >= 8 columns
+    n = len(df)
+    epochs     = df[0].astype(np.int64).to_numpy()
+    mean_ops   = df[1].astype(np.float64).to_numpy()
+    median_ops = df[2].astype(np.float64).to_numpy()
+    if has_steps:
+        mean_steps = df[3].astype(np.float64).to_numpy()
+        max_steps  = df[4].astype(np.int64).to_numpy()
+        unique_ids = df[5].astype(np.int64).to_numpy()
+        last = df[7]
+    else:
+        mean_steps = np.full(n, np.nan)
+        max_steps  = np.zeros(n, dtype=np.int64)
+        unique_ids = df[3].astype(np.int64).to_numpy()
+        last = df[5]
+    modal_counts = (last.str.extract(_MODAL_RE)[0]
+                    .fillna(0).astype(np.int64).to_numpy())
+    return (epochs, mean_ops, median_ops, mean_steps, max_steps,
+            unique_ids, modal_counts)
+
+
+if HAS_NUMBA:
+    @numba.njit(cache=True)
+    def _atoi(buf, s, e):
+        val = 0
+        while s < e and 48 <= buf[s] <= 57:
+            val = val * 10 + (buf[s] - 48)
+            s += 1
+        return val
+
+    @numba.njit(cache=True)
+    def _atof(buf, s, e):
+        while s < e and buf[s] == 32:
+            s += 1
+        sign = 1.0
+        if s < e and (buf[s] == 45 or buf[s] == 43):
+            if buf[s] == 45:
+                sign = -1.0
+            s += 1
+        val = 0.0
+        while s < e and 48 <= buf[s] <= 57:
+            val = val * 10.0 + (buf[s] - 48)
+            s += 1
+        if s < e and buf[s] == 46:  # '.'
+            s += 1
+            frac = 0.1
+            while s < e and 48 <= buf[s] <= 57:
+                val += (buf[s] - 48) * frac
+                frac *= 0.1
+                s += 1
+        if s < e and (buf[s] == 101 or buf[s] == 69):  # 'e'/'E'
+            s += 1
+            esign = 1
+            if s < e and (buf[s] == 45 or buf[s] == 43):
+                if buf[s] == 45:
+                    esign = -1
+                s += 1
+            val *= 10.0 ** (esign * _atoi(buf, s, e))
+        return sign * val
+
+    @numba.njit(cache=True)
+    def _parse_buf(buf):
+        n_lines = 1
+        for i in range(buf.size):
+            if buf[i] == 10:
+                n_lines += 1
+        epochs       = np.empty(n_lines, np.int64)
+        mean_ops     = np.empty(n_lines, np.float64)
+        median_ops   = np.empty(n_lines, np.float64)
+        mean_steps   = np.empty(n_lines, np.float64)
+        max_steps    = np.empty(n_lines, np.int64)
+        unique_ids   = np.empty(n_lines, np.int64)
+        modal_counts = np.empty(n_lines, np.int64)
+        vals = np.zeros(6, np.float64)
+        n = 0
+        i = 0
+        N = buf.size
+        while i < N:
+            j = i
+            while j < N and buf[j] != 10:
+                j += 1
+            k = i
+            while k < j and (buf[k] == 32 or buf[k] == 9):
+                k += 1
+            if k < j and 48 <= buf[k] <= 57:
+                # split on tabs; numeric prefix fields go into vals,
+                # the last field keeps its span for the "(count)" suffix
+                nf = 0
+                fstart = i
+                last_start = i
+                last_end = j
+                p = i
+                while p <= j:
+                    if p == j or buf[p] == 9:
+                        if nf < 6:
+                            vals[nf] = _atof(buf, fstart, p)
+                        last_start = fstart
+                        last_end = p
+                        nf += 1
+                        fstart = p + 1
+                    p += 1
+                epochs[n]     = np.int64(vals[0])
+                mean_ops[n]   = vals[1]
+                median_ops[n] = vals[2]
+                if nf >= 8:  # new format
+                    mean_steps[n] = vals[3]
+                    max_steps[n]  = np.int64(vals[4])
+                    unique_ids[n] = np.int64(vals[5])
+                else:
+                    mean_steps[n] = np.nan
+                    max_steps[n]  = 0
+                    unique_ids[n] = np.int64(vals[3])
+                mc = 0
+                q = last_end - 1
+                while q >= last_start and (buf[q] == 32 or buf[q] == 13):
+                    q -= 1
+                if q >= last_start and buf[q] == 41:  # ')'
+                    q -= 1
+                    end_d = q
+                    while q >= last_start and 48 <= buf[q] <= 57:
+                        q -= 1
+                    if q >= last_start and buf[q] == 40 and end_d > q:  # '('
+                        mc = _atoi(buf, q + 1, end_d + 1)
+                modal_counts[n] = mc
+                n += 1
+            i = j + 1
+        return (epochs[:n], mean_ops[:n], median_ops[:n], mean_steps[:n],
+                max_steps[:n], unique_ids[:n], modal_counts[:n])
+
+
+def _parse_numba(path):
+    """JIT fallback: one compiled pass over the raw bytes."""
+    with open(path, 'rb') as f:
+        buf = np.frombuffer(f.read(), dtype=np.uint8)
+    return _parse_buf(buf)
+
+
+def _parse_python(path):
     epochs, mean_ops, median_ops, mean_steps, max_steps, unique_ids, modal_counts = \
         [], [], [], [], [], [], []
     with open(path) as f:
@@ -39,12 +196,29 @@ def parse(path):
                 max_steps.append(0)
                 unique_ids.append(int(parts[3]))
                 last = parts[5]
-            m = re.search(r'\((\d+)\)\s*$', last)
-            modal_counts.append(int(m.group(1)) if m else 0)
+            _, sep, tail = last.rpartition('(')
+            tail = tail.rstrip(') ')
+            modal_counts.append(int(tail) if sep and tail.isdigit() else 0)
     return (np.array(epochs), np.array(mean_ops), np.array(median_ops),
             np.array(mean_steps), np.array(max_steps),
             np.array(unique_ids), np.array(modal_counts))
 
+
+def parse(path):
+    if HAS_PANDAS:
+        out = _parse_pandas(path)
+    elif HAS_NUMBA:
+        out = _parse_numba(path)
+    else:
+        out = _parse_python(path)
+    ep, mean, med, msteps, xsteps, uniq, modal = out
+    # Plotting doesn't need 64-bit precision; downcasting halves the
+    # memory matplotlib drags through for long runs.
+    return (ep.astype(np.uint32), mean.astype(np.float32),
+            med.astype(np.float32), msteps.astype(np.float32),
+            xsteps.astype(np.uint32), uniq.astype(np.uint32),
+            modal.astype(np.uint32))
+
 def main():
     if len(sys.argv) < 2:
         print(__doc__)
@@ -61,8 +235,9 @@ def main():
 
     # --- mean / median ops ---
     ax = axes[0]
-    ax.plot(ep, mean, label='mean ops', color='steelblue')
-    ax.plot(ep, med,  label='median ops', color='orange', linestyle='--')
+    ax.plot(ep, mean, label='mean ops', color='steelblue', rasterized=True)
+    ax.plot(ep, med,  label='median ops', color='orange', linestyle='--',
+            rasterized=True)
     ax.set_ylabel('ops per tape')
     ax.legend()
     ax.grid(True, alpha=0.3)
@@ -70,9 +245,11 @@ def main():
     # --- mean / max steps ---
     if has_steps:
         ax = axes[1]
-        ax.plot(ep, msteps, label='mean steps', color='steelblue')
+        ax.plot(ep, msteps, label='mean steps', color='steelblue',
+                rasterized=True)
         ax2 = ax.twinx()
-        ax2.plot(ep, xsteps, label='max steps', color='tomato', alpha=0.6)
+        ax2.plot(ep, xsteps, label='max steps', color='tomato', alpha=0.6,
+                 rasterized=True)
         ax2.set_ylabel('max steps', color='tomato')
         ax.set_ylabel('mean steps')
         ax.legend(loc='upper left')
@@ -81,7 +258,7 @@ def main():
 
     # --- unique IDs ---
     ax = axes[2 if has_steps else 1]
-    ax.plot(ep, uniq, color='forestgreen')
+    ax.plot(ep, uniq, color='forestgreen', rasterized=True)
     ax.set_ylabel('unique token IDs')
     ax.yaxis.set_major_formatter(ticker.FuncFormatter(
         lambda x, _: f'{x/1e6:.1f}M' if x >= 1e5 else f'{int(x):,}'))
@@ -89,14 +266,14 @@ def main():
 
     # --- modal lineage count ---
     ax = axes[3 if has_steps else 2]
-    ax.plot(ep, modal, color='crimson')
+    ax.plot(ep, modal, color='crimson', rasterized=True)
     ax.set_ylabel('modal lineage count')
     ax.set_xlabel('epoch')
     ax.yaxis.set_major_formatter(ticker.FuncFormatter(lambda x, _: f'{int(x):,}'))
     ax.grid(True, alpha=0.3)
 
     fig.tight_layout()
-    fig.savefig(out, dpi=150)
+    fig.savefig(out, dpi=150, pil_kwargs={'compress_level': 3})
     print(f'Saved to {out}')
 
 if __name__ == '__main__':
@@ -10,8 +10,10 @@ median_ops, unique_ids).
 """
 
 import sys
-import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.lines import Line2D
+
+from soup_io import load_epoch_unique
 
 def main():
     if len(sys.argv) < 2:
@@ -21,18 +23,7 @@ def main():
     tsv_path = sys.argv[1]
     out_path = sys.argv[2] if len(sys.argv) > 2 else tsv_path.replace('.tsv', '') + '_tokens.png'
 
-    epochs, unique = [], []
-    with open(tsv_path) as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('epoch'):
-                continue
-            parts = line.split()
-            epochs.append(int(parts[0]))
-            unique.append(int(parts[3]))
-
-    epochs = np.array(epochs)
-    unique = np.array(unique)
+    epochs, unique = load_epoch_unique(tsv_path)
 
     fig, axes = plt.subplots(1, 2, figsize=(14, 5))
 
@@ -40,7 +31,9 @@ def main():
         (axes[0], 'linear', 'Unique token IDs vs epoch (linear)'),
         (axes[1], 'log',    'Unique token IDs vs epoch (log scale)'),
     ]:
-        ax.plot(epochs, unique, color='steelblue', linewidth=1.2)
+        # Line2D keeps references, so both panels share one pair of arrays
+        ax.add_line(Line2D(epochs, unique, color='steelblue', linewidth=1.2))
+        ax.autoscale_view()
         ax.set_xlabel('Epoch')
         ax.set_ylabel('Unique token IDs')
         ax.set_yscale(yscale)
@@ -51,7 +44,7 @@ def main():
 
     fig.suptitle('BFF soup — lineage diversity (seed=12345, mutation=1e-6)')
     fig.tight_layout()
-    fig.savefig(out_path, dpi=150)
+    fig.savefig(out_path, dpi=150, pil_kwargs={'compress_level': 3})
     print(f"Saved to {out_path}")
 
 if __name__ == '__main__':
@@ -25,10 +25,12 @@ Commands (in REPL):
 
 import sys
 import os
-import struct
-import argparse
-import readline
-from collections import Counter
+import re
+import heapq
+import array
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import numpy as np
@@ -37,6 +39,12 @@ except ImportError:
     print("Warning: numpy not available; loading will be slow", file=sys.stderr)
     HAS_NUMPY = False
 
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 # ── BFF constants ──────────────────────────────────────────────────────────────
 BFF_TAPE_LEN   = 128
 BFF_HALF_LEN   = 64
@@ -45,13 +53,34 @@ BFF_MAX_STEPS  = 16384
 BFF_STACK_DEPTH = 64
 BFF_OPS        = set(b'<>+-,[]')
 
+if HAS_NUMPY:
+    OP_LUT = np.zeros(256, dtype=np.uint8)   # 1 where the byte is a BFF op
+    OP_LUT[list(BFF_OPS)] = 1
+
+    # native (little-endian) layout of the packed 64-bit token
+    TOKEN_DT = np.dtype([('char', np.uint8), ('_pad', np.uint8),
+                         ('epoch', np.uint16), ('id', np.uint32)])
+    assert TOKEN_DT.itemsize == 8
+
 # ── Global config (overridden by metadata.txt) ─────────────────────────────────
 CFG = dict(soup_size=131072, half_len=64, npairs=65536)
 
 # ── Caches ──────────────────────────────────────────────────────────────────────
-_soup_cache  = {}   # epoch -> np.ndarray (SOUP_SIZE, HALF_LEN) uint64
+_soup_cache  = OrderedDict()   # epoch -> memmap (SOUP_SIZE, HALF_LEN) uint64, LRU
 _perm_cache  = {}   # epoch -> np.ndarray SOUP_SIZE uint32
 _steps_cache = {}   # epoch -> np.ndarray NPAIRS uint32
+_invperm_cache = {} # epoch -> (inv_a, inv_b) int32 arrays, tape idx -> pair idx
+_fields_cache  = OrderedDict()  # epoch -> (chars u8, ids u32, epochs u16) SoA, LRU
+_stats_cache = {}   # epoch -> (soup mtime, stats dict)
+_tape_str_cache = OrderedDict()  # (epoch, tape_idx, mtime) -> rendered string, LRU
+
+TAPE_STR_CACHE_MAX = 4096
+
+SOUP_CACHE_MAX = 4  # soup mmaps kept open at once
+
+# auto_analyze computes stats from a thread pool; the lock keeps the LRU
+# insert/evict/hit sequences atomic so a concurrent evict can't race a lookup.
+_cache_lock = threading.Lock()
 
 TRACE_DIR = None
 
@@ -80,33 +109,52 @@ def _bin_path(epoch, kind):
     return os.path.join(TRACE_DIR, f"epoch{epoch}_{kind}.bin")
 
 
+EPOCH_RE = re.compile(r'epoch(\d+)_soup\.bin$')
+_epochs_cache = {'mtime': None, 'val': []}
+
 def available_epochs():
+    # listdir once per directory change, not once per command
+    mtime = os.stat(TRACE_DIR).st_mtime_ns
+    if mtime == _epochs_cache['mtime']:
+        return _epochs_cache['val']
     epochs = []
     for fn in os.listdir(TRACE_DIR):
-        if fn.startswith("epoch") and fn.endswith("_soup.bin"):
-            try:
-                epochs.append(int(fn[5:fn.index("_soup")]))
-            except ValueError:
-                pass
-    return sorted(epochs)
+        m = EPOCH_RE.match(fn)
+        if m:
+            epochs.append(int(m.group(1)))
+    epochs.sort()
+    _epochs_cache['mtime'] = mtime
+    _epochs_cache['val']   = epochs
+    return epochs
 
 
 def load_soup(epoch):
-    if epoch not in _soup_cache:
-        path = _bin_path(epoch, "soup")
-        if not os.path.exists(path):
-            print(f"  No soup snapshot for epoch {epoch}")
-            return None
-        if HAS_NUMPY:
-            arr = np.fromfile(path, dtype=np.uint64)
-            _soup_cache[epoch] = arr.reshape(CFG['soup_size'], CFG['half_len'])
-        else:
-            sz = CFG['soup_size'] * CFG['half_len']
-            with open(path, 'rb') as f:
-                data = struct.unpack(f"{sz}Q", f.read(sz * 8))
-            import array
-            _soup_cache[epoch] = data  # flat tuple fallback
-    return _soup_cache[epoch]
+    with _cache_lock:
+        soup = _soup_cache.get(epoch)
+        if soup is not None:
+            _soup_cache.move_to_end(epoch)
+            return soup
+    path = _bin_path(epoch, "soup")
+    if not os.path.exists(path):
+        print(f"  No soup snapshot for epoch {epoch}")
+        return None
+    if HAS_NUMPY:
+        # mmap: pages fault in on demand, no up-front 64 MiB read per epoch
+        soup = np.memmap(path, dtype=np.uint64, mode='r',
+                         shape=(CFG['soup_size'], CFG['half_len']))
+    else:
+        # typed buffer: one memcpy, no giant format string or tuple of ints
+        sz = CFG['soup_size'] * CFG['half_len']
+        soup = array.array('Q')  # flat array fallback
+        with open(path, 'rb') as f:
+            soup.frombytes(f.read(sz * 8))
+    # Return the local reference, not a re-lookup: another thread may evict
+    # our entry before we get back to it, and evicted holders keep theirs.
+    with _cache_lock:
+        _soup_cache[epoch] = soup
+        while len(_soup_cache) > SOUP_CACHE_MAX:
+            _soup_cache.popitem(last=False)
+    return soup
 
 
 def load_perm(epoch):
@@ -115,11 +163,13 @@ def load_perm(epoch):
         if not os.path.exists(path):
             return None
         if HAS_NUMPY:
-            _perm_cache[epoch] = np.fromfile(path, dtype=np.uint32)
+            _perm_cache[epoch] = np.memmap(path, dtype=np.uint32, mode='r',
+                                           shape=(CFG['soup_size'],))
         else:
-            sz = CFG['soup_size']
+            data = array.array('I')
             with open(path, 'rb') as f:
-                _perm_cache[epoch] = struct.unpack(f"{sz}I", f.read(sz * 4))
+                data.frombytes(f.read(CFG['soup_size'] * 4))
+            _perm_cache[epoch] = data
     return _perm_cache[epoch]
 
 
@@ -129,14 +179,91 @@ def load_steps(epoch):
         if not os.path.exists(path):
             return None
         if HAS_NUMPY:
-            _steps_cache[epoch] = np.fromfile(path, dtype=np.uint32)
+            _steps_cache[epoch] = np.memmap(path, dtype=np.uint32, mode='r',
+                                            shape=(CFG['npairs'],))
         else:
-            sz = CFG['npairs']
+            data = array.array('I')
             with open(path, 'rb') as f:
-                _steps_cache[epoch] = struct.unpack(f"{sz}I", f.read(sz * 4))
+                data.frombytes(f.read(CFG['npairs'] * 4))
+            _steps_cache[epoch] = data
     return _steps_cache[epoch]
 
 
+def load_fields(epoch):
+    """Per-epoch SoA decomposition of the soup: (chars, ids, epochs) arrays.
+
+    Display and stats paths all need the same token fields; extracting them
+    once per epoch replaces repeated shift/mask passes over the full uint64
+    soup with reads of the narrower cached planes.
+    """
+    with _cache_lock:
+        fields = _fields_cache.get(epoch)
+        if fields is not None:
+            _fields_cache.move_to_end(epoch)
+            return fields
+    soup = load_soup(epoch)
+    if soup is None:
+        return None
+    if sys.byteorder == 'little':
+        # TOKEN_DT matches the in-memory token layout, so each plane is a
+        # zero-copy field view — no shift/mask kernels, no temporaries
+        sv = soup.view(TOKEN_DT)
+        chars = sv['char']
+        eps   = sv['epoch']
+        ids   = sv['id']
+    else:
+        chars = (soup & 0xFF).astype(np.uint8)
+        ids   = (soup >> 32).astype(np.uint32)
+        eps   = ((soup >> 16) & 0xFFFF).astype(np.uint16)
+    fields = (chars, ids, eps)
+    with _cache_lock:
+        _fields_cache[epoch] = fields
+        while len(_fields_cache) > SOUP_CACHE_MAX:
+            _fields_cache.popitem(last=False)
+    return fields
+
+
+def load_invperm(epoch):
+    """Inverse permutation: tape index -> pair index, one array per role."""
+    if epoch not in _invperm_cache:
+        perm = load_perm(epoch)
+        if perm is None:
+            return None
+        npairs = CFG['npairs']
+        inv_a = np.full(CFG['soup_size'], -1, dtype=np.int32)
+        inv_b = np.full(CFG['soup_size'], -1, dtype=np.int32)
+        inv_a[perm[:npairs]] = np.arange(npairs, dtype=np.int32)
+        inv_b[perm[npairs:]] = np.arange(npairs, dtype=np.int32)
+        _invperm_cache[epoch] = (inv_a, inv_b)
+    return _invperm_cache[epoch]
+
+
+def find_pair(tape_idx, epoch):
+    """Locate the pair containing tape_idx at epoch: (pair_i, role) or None."""
+    if not 0 <= tape_idx < CFG['soup_size']:
+        return None  # keep negative indices from wrapping into inv_a/inv_b
+    if HAS_NUMPY:
+        inv = load_invperm(epoch)
+        if inv is None:
+            return None
+        inv_a, inv_b = inv
+        if inv_a[tape_idx] >= 0:
+            return int(inv_a[tape_idx]), 'A'
+        if inv_b[tape_idx] >= 0:
+            return int(inv_b[tape_idx]), 'B'
+        return None
+    perm = load_perm(epoch)
+    if perm is None:
+        return None
+    npairs = CFG['npairs']
+    for i in range(npairs):
+        if perm[i] == tape_idx:
+            return i, 'A'
+        if perm[i + npairs] == tape_idx:
+            return i, 'B'
+    return None
+
+
 # ── Token field extraction ─────────────────────────────────────────────────────
 
 def tok_char(t):
@@ -151,58 +278,95 @@ def tok_epoch(t):
 def is_op(ch):
     return ch in BFF_OPS
 
+# Rendering LUTs: one C-level translate per tape instead of a Python loop
+_TAPE_XLATE = bytes(c if c in BFF_OPS else 0x2E for c in range(256))
+_OP_NAME    = [chr(c) if c in BFF_OPS else f"0x{c:02x}" for c in range(256)]
+_BYTE_STRS  = [f"\033[1;32m{chr(c)}\033[0m " if c in BFF_OPS else f"{c:02x} "
+               for c in range(256)]
+
 def tape_str(half_tape, mark_ops=True):
     """Format a HALF_LEN token array as a string (op char or '.' for data)."""
-    chars = []
-    for t in half_tape:
-        ch = tok_char(t)
-        if mark_ops and ch in BFF_OPS:
-            chars.append(chr(ch))
-        else:
-            chars.append('.')
-    return ''.join(chars)
+    if HAS_NUMPY and isinstance(half_tape, np.ndarray):
+        if half_tape.dtype != np.uint8:
+            half_tape = (half_tape & 0xFF).astype(np.uint8)
+        row = half_tape.tobytes()
+    else:
+        row = bytes(int(t) & 0xFF for t in half_tape)
+    if not mark_ops:
+        return '.' * len(row)
+    return row.translate(_TAPE_XLATE).decode('ascii')
 
 def tape_str_full(half_tape):
     """Show all bytes as printable hex pairs, ops highlighted."""
-    out = []
-    for t in half_tape:
-        ch = tok_char(t)
-        if ch in BFF_OPS:
-            out.append(f"\033[1;32m{chr(ch)}\033[0m ")
-        else:
-            out.append(f"{ch:02x} ")
-    return ''.join(out)
+    return ''.join(_BYTE_STRS[int(t) & 0xFF] for t in half_tape)
+
+_OP_BYTES = b'<>+-,[]'
+
+def tape_str_at(epoch, tape_idx):
+    """tape_str for one soup row, memoized per (epoch, tape, snapshot mtime)."""
+    try:
+        mtime = os.path.getmtime(_bin_path(epoch, "soup"))
+    except OSError:
+        mtime = None
+    key = (epoch, tape_idx, mtime)
+    v = _tape_str_cache.get(key)
+    if v is not None:
+        _tape_str_cache.move_to_end(key)
+        return v
+    soup = load_soup(epoch)
+    if soup is None:
+        return None
+    v = tape_str(soup[tape_idx])
+    _tape_str_cache[key] = v
+    while len(_tape_str_cache) > TAPE_STR_CACHE_MAX:
+        _tape_str_cache.popitem(last=False)
+    return v
+
+def render_tapes(epoch):
+    """All tapes at epoch as an (ss, hl) uint8 matrix of op chars and '.'."""
+    chars = load_fields(epoch)[0]
+    return np.where(OP_LUT[chars].astype(bool), chars, np.uint8(0x2E))
 
 def count_ops(half_tape):
-    return sum(1 for t in half_tape if tok_char(t) in BFF_OPS)
+    if HAS_NUMPY and isinstance(half_tape, np.ndarray):
+        if half_tape.dtype != np.uint8:
+            half_tape = (half_tape & 0xFF).astype(np.uint8)
+        return int(OP_LUT[half_tape].sum())
+    b = bytes(int(t) & 0xFF for t in half_tape)
+    return sum(b.count(op) for op in _OP_BYTES)
 
 
 # ── Stats ──────────────────────────────────────────────────────────────────────
 
 def compute_stats(epoch):
+    # stats are pure functions of the snapshot; recompute only if it changed
+    mtime = None
+    path = _bin_path(epoch, "soup")
+    if os.path.exists(path):
+        mtime = os.path.getmtime(path)
+        hit = _stats_cache.get(epoch)
+        if hit is not None and hit[0] == mtime:
+            return hit[1]
     soup = load_soup(epoch)
     if soup is None:
         return None
     ss = CFG['soup_size']
     hl = CFG['half_len']
     if HAS_NUMPY:
-        chars = (soup & 0xFF).astype(np.uint8)
-        op_mask = np.zeros(256, dtype=bool)
-        for b in BFF_OPS:
-            op_mask[b] = True
-        ops_per_tape = op_mask[chars].sum(axis=1)
+        chars, ids, eps = load_fields(epoch)
+        ops_per_tape = OP_LUT[chars].sum(axis=1)
         mean_ops   = float(ops_per_tape.mean())
         median_ops = float(np.median(ops_per_tape))
 
-        ids = (soup >> 32).astype(np.uint32).flatten()
-        unique = int(np.unique(ids).size)
-        counter = Counter(ids.tolist())
-        modal_id, modal_count = counter.most_common(1)[0]
+        uniq, counts = np.unique(ids, return_counts=True)
+        unique = int(uniq.size)
+        k = int(counts.argmax())
+        modal_id, modal_count = int(uniq[k]), int(counts[k])
 
         # epoch field distribution of the modal ID tokens
-        modal_mask = (soup >> 32).astype(np.uint32) == modal_id
-        modal_epochs = ((soup[modal_mask] >> 16) & 0xFFFF).tolist()
-        epoch_dist = Counter(modal_epochs)
+        modal_mask = ids == modal_id
+        ev, ec = np.unique(eps[modal_mask], return_counts=True)
+        epoch_dist = dict(zip(ev.tolist(), ec.tolist()))
     else:
         ops_per_tape = [count_ops(soup[i*hl:(i+1)*hl]) for i in range(ss)]
         mean_ops   = sum(ops_per_tape) / ss
@@ -214,9 +378,11 @@ def compute_stats(epoch):
         modal_id, modal_count = counter.most_common(1)[0]
         epoch_dist = {}
 
-    return dict(epoch=epoch, mean_ops=mean_ops, median_ops=median_ops,
-                unique=unique, modal_id=modal_id, modal_count=modal_count,
-                epoch_dist=epoch_dist)
+    result = dict(epoch=epoch, mean_ops=mean_ops, median_ops=median_ops,
+                  unique=unique, modal_id=modal_id, modal_count=modal_count,
+                  epoch_dist=epoch_dist)
+    _stats_cache[epoch] = (mtime, result)
+    return result
 
 
 # ── Display helpers ────────────────────────────────────────────────────────────
@@ -233,21 +399,23 @@ def show_tape(tape_idx, epoch):
     print(f"  Bytes: |{tape_str_full(half)}|")
     # Token ID distribution
     if HAS_NUMPY:
-        ids = (half >> 32).astype(np.uint32)
-        id_counts = Counter(ids.tolist())
+        ids = load_fields(epoch)[1][tape_idx]
+        uniq, cnt = np.unique(ids, return_counts=True)
+        order = np.argsort(-cnt, kind='stable')[:4]
+        top_ids = [(int(uniq[i]), int(cnt[i])) for i in order]
     else:
-        id_counts = Counter(tok_id(t) for t in half)
-    top_ids = id_counts.most_common(4)
+        top_ids = Counter(tok_id(t) for t in half).most_common(4)
     print(f"  Top token IDs: " +
           ", ".join(f"id={i} ×{c}" for i, c in top_ids))
-    # Per-cell detail
-    print(f"\n  idx  op  char  token_id    tok_epoch")
+    # Per-cell detail: build the table and write it in one call
+    lines = [f"\n  idx  op  char  token_id    tok_epoch"]
     for j, t in enumerate(half):
         ch  = tok_char(t)
         tid = tok_id(t)
         tep = tok_epoch(t)
         op  = chr(ch) if ch in BFF_OPS else f"0x{ch:02x}"
-        print(f"  {j:3d}  {op:<4}  {ch:3d}  {tid:>10}  {tep:>9}")
+        lines.append(f"  {j:3d}  {op:<4}  {ch:3d}  {tid:>10}  {tep:>9}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def show_pair(tape_idx, epoch):
@@ -259,27 +427,11 @@ def show_pair(tape_idx, epoch):
         return
     npairs = CFG['npairs']
 
-    # Find pair index
-    pair_i = None
-    if HAS_NUMPY:
-        pa = perm[:npairs]
-        pb = perm[npairs:]
-        idxs_a = np.where(pa == tape_idx)[0]
-        idxs_b = np.where(pb == tape_idx)[0]
-        if len(idxs_a):
-            pair_i = int(idxs_a[0]); role = 'A'
-        elif len(idxs_b):
-            pair_i = int(idxs_b[0]); role = 'B'
-    else:
-        for i in range(npairs):
-            if perm[i] == tape_idx:
-                pair_i = i; role = 'A'; break
-            if perm[i + npairs] == tape_idx:
-                pair_i = i; role = 'B'; break
-
-    if pair_i is None:
+    hit = find_pair(tape_idx, epoch)
+    if hit is None:
         print(f"  Tape {tape_idx} not found in epoch {epoch} pairing?")
         return
+    pair_i, role = hit
 
     ai = int(perm[pair_i])
     bi = int(perm[pair_i + npairs])
@@ -295,9 +447,9 @@ def show_pair(tape_idx, epoch):
     for label, tidx in [('A', ai), ('B', bi)]:
         print(f"\n  ── Tape {tidx} ({label}) ──")
         if soup_before is not None:
-            print(f"     before: |{tape_str(soup_before[tidx])}|")
+            print(f"     before: |{tape_str_at(prev, tidx)}|")
         if soup_after is not None:
-            print(f"     after:  |{tape_str(soup_after[tidx])}|")
+            print(f"     after:  |{tape_str_at(epoch, tidx)}|")
 
 
 def show_top_pairs(epoch, k=10):
@@ -311,9 +463,28 @@ def show_top_pairs(epoch, k=10):
     soup_after  = load_soup(epoch)
 
     if HAS_NUMPY:
-        top_idx = np.argsort(steps)[::-1][:k].tolist()
+        # partition to the top k, then sort just those k
+        k = min(k, len(steps))
+        if k <= 0:
+            # argpartition(steps, -0)[-0:] is the whole array, not none of it
+            top_idx = []
+        else:
+            part = np.argpartition(steps, -k)[-k:]
+            top_idx = part[np.argsort(steps[part])[::-1]].tolist()
     else:
-        top_idx = sorted(range(npairs), key=lambda i: steps[i], reverse=True)[:k]
+        top_idx = heapq.nlargest(k, range(npairs), key=lambda i: steps[i])
+
+    # Pre-render both snapshots in one pass each; each table cell is then
+    # just a row slice + decode instead of a tape_str call.
+    rend_before = render_tapes(epoch - 1) \
+        if HAS_NUMPY and soup_before is not None else None
+    rend_after  = render_tapes(epoch) \
+        if HAS_NUMPY and soup_after is not None else None
+
+    def s(soup, rend, idx):
+        if rend is not None:
+            return rend[idx].tobytes().decode('ascii')
+        return tape_str(soup[idx]) if soup is not None else '?'*64
 
     print(f"\n  Top {k} pairs by step count in epoch {epoch}:")
     print(f"  {'pair':>6}  {'A':>7}  {'B':>7}  {'steps':>7}  A-before / A-after  B-before / B-after")
@@ -321,11 +492,33 @@ def show_top_pairs(epoch, k=10):
         ai  = int(perm[pi])
         bi  = int(perm[pi + npairs])
         st  = int(steps[pi])
-        def s(soup, idx):
-            return tape_str(soup[idx]) if soup is not None else '?'*64
         print(f"  {pi:>6}  {ai:>7}  {bi:>7}  {st:>7}"
-              f"  |{s(soup_before,ai)[:20]}…|→|{s(soup_after,ai)[:20]}…|"
-              f"  |{s(soup_before,bi)[:20]}…|→|{s(soup_after,bi)[:20]}…|")
+              f"  |{s(soup_before,rend_before,ai)[:20]}…|→|{s(soup_after,rend_after,ai)[:20]}…|"
+              f"  |{s(soup_before,rend_before,bi)[:20]}…|→|{s(soup_after,rend_after,bi)[:20]}…|")
+
+
+if HAS_NUMPY and HAS_NUMBA:
+    @numba.njit(cache=True, parallel=True)
+    def _lineage_scan(soup, mid):
+        """Per-tape count of tokens whose id field equals mid, one soup pass."""
+        ss, hl = soup.shape
+        counts = np.zeros(ss, np.int32)
+        for i in numba.prange(ss):
+            c = 0
+            for j in range(hl):
+                if (soup[i, j] >> np.uint64(32)) == mid:
+                    c += 1
+            counts[i] = c
+        return counts
+
+
+def lineage_counts(epoch, mid):
+    """Per-tape count of tokens carrying id mid at epoch."""
+    if HAS_NUMBA:
+        # fused scan reads the uint64 soup exactly once
+        return _lineage_scan(np.asarray(load_soup(epoch)), np.uint64(mid))
+    ids = load_fields(epoch)[1]
+    return (ids == mid).sum(axis=1)
 
 
 def show_lineage(epoch):
@@ -345,11 +538,10 @@ def show_lineage(epoch):
     soup = load_soup(epoch)
     if soup is not None and HAS_NUMPY:
         mid = st['modal_id']
-        ids = (soup >> 32).astype(np.uint32)
-        counts = (ids == mid).sum(axis=1)
+        counts = lineage_counts(epoch, mid)
         best_tape = int(counts.argmax())
         print(f"    Best tape for modal ID: tape {best_tape} ({int(counts[best_tape])} cells with modal ID)")
-        print(f"      Instr: |{tape_str(soup[best_tape])}|")
+        print(f"      Instr: |{tape_str_at(epoch, best_tape)}|")
 
 
 def trace_lineage():
@@ -375,15 +567,14 @@ def trace_lineage():
         if soup is None:
             continue
         if HAS_NUMPY:
-            ids    = (soup >> 32).astype(np.uint32)
-            counts = (ids == mid).sum(axis=1)
+            counts = lineage_counts(ep, mid)
             total  = int(counts.sum())
             if total == 0:
                 print(f"  epoch {ep:3d}: ID {mid} not present")
                 continue
             best = int(counts.argmax())
             n    = int(counts[best])
-            instr = tape_str(soup[best])
+            instr = tape_str_at(ep, best)
         else:
             total = 0; best = 0; n = 0; instr = '?'*64
         perm  = load_perm(ep)
@@ -391,23 +582,63 @@ def trace_lineage():
         step_info = ""
         if perm is not None and steps is not None:
             npairs = CFG['npairs']
-            perm_a = perm[:npairs]; perm_b = perm[npairs:]
             if HAS_NUMPY:
-                idxs_a = np.where(perm_a == best)[0]
-                idxs_b = np.where(perm_b == best)[0]
-                if len(idxs_a):
-                    pi = int(idxs_a[0])
-                    partner = int(perm_b[pi])
-                    step_info = f"  paired with {partner}, {int(steps[pi])} steps"
-                elif len(idxs_b):
-                    pi = int(idxs_b[0])
-                    partner = int(perm_a[pi])
+                hit = find_pair(best, ep)
+                if hit is not None:
+                    pi, role = hit
+                    partner = int(perm[pi + npairs] if role == 'A' else perm[pi])
                     step_info = f"  paired with {partner}, {int(steps[pi])} steps"
         print(f"  epoch {ep:3d}: {total:>8,} cells  best tape={best:6d} ({n:2d} cells)  |{instr}|{step_info}")
 
 
 # ── BFF step-by-step tracer ────────────────────────────────────────────────────
 
+if HAS_NUMPY and HAS_NUMBA:
+    @numba.njit(cache=True, boundscheck=False)
+    def _bff_run_fast(tape, max_steps):
+        """Silent BFF interpreter over a 128-token uint64 tape (mutates it)."""
+        mask8  = np.uint64(0xFF)
+        nmask8 = np.uint64(0xFFFFFFFFFFFFFF00)
+        ipmask = BFF_TAPE_LEN - 1
+        ip    = BFF_IP_START
+        head0 = np.int64(tape[0] & mask8) & ipmask
+        head1 = np.int64(tape[1] & mask8) & ipmask
+        stack = np.empty(BFF_STACK_DEPTH, np.int32)
+        sp    = 0
+        steps = 0
+        limit = min(max_steps, BFF_MAX_STEPS)
+        while steps < limit:
+            steps += 1
+            ch = np.int64(tape[ip] & mask8)
+            if ch == 60:    # '<'
+                head0 = (head0 - 1) & ipmask
+            elif ch == 62:  # '>'
+                head0 = (head0 + 1) & ipmask
+            elif ch == 43:  # '+'
+                new = (np.int64(tape[head0] & mask8) + 1) & 0xFF
+                tape[head0] = (tape[head0] & nmask8) | np.uint64(new)
+            elif ch == 45:  # '-'
+                new = (np.int64(tape[head0] & mask8) - 1) & 0xFF
+                tape[head0] = (tape[head0] & nmask8) | np.uint64(new)
+            elif ch == 44:  # ','
+                tape[head1] = tape[head0]
+                head1 = (head1 + 1) & ipmask
+            elif ch == 91:  # '['
+                if sp >= BFF_STACK_DEPTH:
+                    break
+                stack[sp] = ip
+                sp += 1
+            elif ch == 93:  # ']'
+                if sp == 0:
+                    break
+                if (tape[head0] & mask8) != 0:
+                    ip = stack[sp - 1]
+                else:
+                    sp -= 1
+            ip = (ip + 1) & ipmask
+        return steps
+
+
 def bff_trace(tape_a, tape_b, max_steps=200, verbose=True):
     """
     Run BFF on combined tape A||B and print each instruction.
@@ -415,11 +646,19 @@ def bff_trace(tape_a, tape_b, max_steps=200, verbose=True):
     Returns (final_tape_a, final_tape_b, steps_taken).
     """
     hl = CFG['half_len']
-    tape = list(tape_a) + list(tape_b)   # 128 tokens
+    if HAS_NUMPY:
+        # fresh uint64 copy: never mutate a cached/memmapped soup row
+        tape = np.concatenate([np.asarray(tape_a, dtype=np.uint64),
+                               np.asarray(tape_b, dtype=np.uint64)])
+        if not verbose and HAS_NUMBA:
+            steps = _bff_run_fast(tape, max_steps)
+            return tape[:hl], tape[hl:], steps
+    else:
+        tape = list(tape_a) + list(tape_b)   # 128 tokens
 
     ip    = BFF_IP_START
-    head0 = tok_char(tape[0]) & (BFF_TAPE_LEN - 1)
-    head1 = tok_char(tape[1]) & (BFF_TAPE_LEN - 1)
+    head0 = (int(tape[0]) & 0xFF) & (BFF_TAPE_LEN - 1)
+    head1 = (int(tape[1]) & 0xFF) & (BFF_TAPE_LEN - 1)
     stack = []
     steps = 0
 
@@ -433,8 +672,9 @@ def bff_trace(tape_a, tape_b, max_steps=200, verbose=True):
 
     while steps < min(max_steps, BFF_MAX_STEPS):
         steps += 1
-        ch = tok_char(tape[ip])
-        op_ch = chr(ch) if ch in BFF_OPS else f"0x{ch:02x}"
+        # fields decoded inline: no LOAD_GLOBAL + call per step
+        ch = int(tape[ip]) & 0xFF
+        op_ch = _OP_NAME[ch]
 
         if ch == ord('<'):
             head0 = (head0 - 1) & (BFF_TAPE_LEN - 1)
@@ -443,19 +683,21 @@ def bff_trace(tape_a, tape_b, max_steps=200, verbose=True):
             head0 = (head0 + 1) & (BFF_TAPE_LEN - 1)
             note(f"head0 → {head0}")
         elif ch == ord('+'):
-            old = tok_char(tape[head0])
+            t = int(tape[head0])
+            old = t & 0xFF
             new = (old + 1) & 0xFF
-            tape[head0] = (tape[head0] & ~0xFF) | new
+            tape[head0] = (t & ~0xFF) | new
             note(f"tape[{head0}] char {old}→{new}")
         elif ch == ord('-'):
-            old = tok_char(tape[head0])
+            t = int(tape[head0])
+            old = t & 0xFF
             new = (old - 1) & 0xFF
-            tape[head0] = (tape[head0] & ~0xFF) | new
+            tape[head0] = (t & ~0xFF) | new
             note(f"tape[{head0}] char {old}→{new}")
         elif ch == ord(','):
-            src_id = tok_id(tape[head0])
+            t = int(tape[head0])
             tape[head1] = tape[head0]
-            note(f"tape[{head1}] ← tape[{head0}] (id={src_id}, ch={tok_char(tape[head0])}); head1 → {(head1+1)&127}")
+            note(f"tape[{head1}] ← tape[{head0}] (id={(t >> 32) & 0xFFFFFFFF}, ch={t & 0xFF}); head1 → {(head1+1)&127}")
             head1 = (head1 + 1) & (BFF_TAPE_LEN - 1)
         elif ch == ord('['):
             if len(stack) >= BFF_STACK_DEPTH:
@@ -467,7 +709,7 @@ def bff_trace(tape_a, tape_b, max_steps=200, verbose=True):
             if not stack:
                 note("empty stack → HALT")
                 break
-            val = tok_char(tape[head0])
+            val = int(tape[head0]) & 0xFF
             if val != 0:
                 ip = stack[-1]
                 note(f"loop (tape[{head0}]={val} ≠ 0) → ip={ip}")
@@ -497,20 +739,10 @@ def show_bff_trace(tape_idx, epoch, max_steps=200):
         print(f"  No pairing data for epoch {epoch}"); return
     npairs = CFG['npairs']
 
-    pair_i = None
-    if HAS_NUMPY:
-        pa = perm[:npairs]; pb = perm[npairs:]
-        ia = np.where(pa == tape_idx)[0]
-        ib = np.where(pb == tape_idx)[0]
-        if len(ia): pair_i = int(ia[0]); role = 'A'
-        elif len(ib): pair_i = int(ib[0]); role = 'B'
-    else:
-        for i in range(npairs):
-            if perm[i] == tape_idx: pair_i = i; role = 'A'; break
-            if perm[i+npairs] == tape_idx: pair_i = i; role = 'B'; break
-
-    if pair_i is None:
+    hit = find_pair(tape_idx, epoch)
+    if hit is None:
         print(f"  Tape {tape_idx} not in epoch {epoch} pairs"); return
+    pair_i, role = hit
 
     ai = int(perm[pair_i])
     bi = int(perm[pair_i + npairs])
@@ -521,8 +753,8 @@ def show_bff_trace(tape_idx, epoch, max_steps=200):
     if soup_before is None:
         print(f"  Need soup snapshot for epoch {epoch-1}"); return
 
-    tape_a = soup_before[ai].tolist() if HAS_NUMPY else soup_before[ai]
-    tape_b = soup_before[bi].tolist() if HAS_NUMPY else soup_before[bi]
+    tape_a = soup_before[ai]
+    tape_b = soup_before[bi]
     print(f"  A before: |{tape_str(tape_a)}|")
     print(f"  B before: |{tape_str(tape_b)}|")
     bff_trace(tape_a, tape_b, max_steps=max_steps)
@@ -535,10 +767,26 @@ def search_tapes(pattern, epoch):
         return
     matches = []
     ss = CFG['soup_size']
-    for i in range(ss):
-        s = tape_str(soup[i])
-        if pattern in s:
-            matches.append((i, s))
+    if HAS_NUMPY:
+        # Render every tape at once, then scan one newline-separated byte
+        # buffer instead of 131K Python strings.
+        rendered = render_tapes(epoch)
+        hl = CFG['half_len']
+        buf = np.concatenate(
+            [rendered, np.full((ss, 1), ord('\n'), np.uint8)], axis=1).tobytes()
+        pat = pattern.encode()
+        rowlen = hl + 1
+        i = buf.find(pat)
+        while i >= 0:
+            idx = i // rowlen
+            row = buf[idx * rowlen:(idx + 1) * rowlen - 1]
+            matches.append((idx, row.decode('ascii')))
+            i = buf.find(pat, (idx + 1) * rowlen)
+    else:
+        for i in range(ss):
+            s = tape_str(soup[i])
+            if pattern in s:
+                matches.append((i, s))
     if not matches:
         print(f"  No tapes matching '{pattern}' at epoch {epoch}")
         return
@@ -561,11 +809,12 @@ def auto_analyze():
     # Per-epoch stats
     print("─── Per-epoch stats ───────────────────────────────────────")
     print(f"  {'epoch':>5}  {'mean_ops':>9}  {'median':>7}  {'unique_ids':>11}  {'modal_count':>12}")
-    for ep in epochs:
-        st = compute_stats(ep)
-        if st:
-            print(f"  {ep:>5}  {st['mean_ops']:>9.3f}  {st['median_ops']:>7.1f}"
-                  f"  {st['unique']:>11,}  {st['modal_count']:>12,}")
+    # epochs are independent and the numpy reductions release the GIL
+    with ThreadPoolExecutor(max_workers=min(8, len(epochs))) as ex:
+        for ep, st in zip(epochs, ex.map(compute_stats, epochs)):
+            if st:
+                print(f"  {ep:>5}  {st['mean_ops']:>9.3f}  {st['median_ops']:>7.1f}"
+                      f"  {st['unique']:>11,}  {st['modal_count']:>12,}")
 
     # Top pairs per epoch
     for ep in epochs[1:]:
@@ -593,6 +842,7 @@ def auto_analyze():
 # ── REPL ──────────────────────────────────────────────────────────────────────
 
 def repl():
+    import readline  # noqa: F401 -- enables line editing in input()
     print(__doc__)
     print(f"Trace directory: {TRACE_DIR}")
     print(f"Config: {CFG}")
@@ -656,6 +906,7 @@ def repl():
 
 def main():
     global TRACE_DIR
+    import argparse
     parser = argparse.ArgumentParser(description="Soup trace analyzer")
     parser.add_argument("trace_dir", help="Directory written by soup --trace-dir")
     parser.add_argument("--auto", action="store_true", help="Run automatic analysis and exit")
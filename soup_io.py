@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""Shared loaders for soup stats TSV output."""
+
+import numpy as np
+
+def load_epoch_unique(path):
+    """Return (epochs, unique_ids) arrays from a soup stats file.
+
+    The stats file is the stdout of soup (tab-separated: epoch, mean_ops,
+    median_ops, unique_ids, ...). Parsing happens in np.loadtxt's C loop;
+    the header line is skipped via the 'epoch' comment token.
+    """
+    data = np.loadtxt(path, dtype=np.int64, usecols=(0, 3),
+                      comments='epoch', ndmin=2)
+    return data[:, 0], data[:, 1]